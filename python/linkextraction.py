@@ -76,26 +76,116 @@ class VideoExtractor:
             logger.error(f"Failed to fetch transcript: {type(e).__name__}: {e}")
             return None
 
+    def get_video_metadata(self, video_url: str, lang: str = 'en') -> Dict:
+        """
+        Resolves transcript, direct URL and duration from a single extract_info pass.
+
+        Captions are read from the caption tracks listed by yt-dlp; the transcript API is only
+        used when no usable track is listed. If a listed track turns out to be unusable the API
+        is tried afterwards rather than speculatively, so that rare case costs one extra trip
+        instead of every video paying for a second transcript fetch.
+        """
+        info = None
+        try:
+            ydl_opts = {'format': 'mp4/best', 'quiet': True, 'no_warnings': True}
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(video_url, download=False)
+            logger.info("Retrieved video info for efficient clip processing")
+        except Exception as e:
+            logger.error(f"Failed to extract video info: {e}")
+
+        if info is None:
+            return {
+                'transcript': self.get_timestamped_transcript_from_url(video_url, lang),
+                'direct_video_url': None,
+                'duration': None,
+            }
+
+        transcript = None
+        caption_url = self._select_caption_url(info, lang)
+        if caption_url:
+            transcript = self._fetch_caption_track(caption_url, info.get('duration'))
+        if transcript is None:
+            logger.info("No usable caption track listed, falling back to transcript API")
+            transcript = self.get_timestamped_transcript_from_url(video_url, lang)
+
+        return {
+            'transcript': transcript,
+            'direct_video_url': info.get('url'),
+            'duration': info.get('duration'),
+        }
+
+    def _select_caption_url(self, info: Dict, lang: str = 'en') -> Optional[str]:
+        # Prefer uploaded subtitles over auto-generated ones, and the requested language over English.
+        # Automatic captions list machine translations under every code, so the original ASR
+        # track ('<lang>-orig') is preferred over the plain code there.
+        for tracks_key in ('subtitles', 'automatic_captions'):
+            tracks = info.get(tracks_key) or {}
+            for wanted in dict.fromkeys([lang, 'en']):
+                preferred = [f"{wanted}-orig", wanted] if tracks_key == 'automatic_captions' else [wanted]
+                candidates = [code for code in tracks if code == wanted or code.startswith(f"{wanted}-")]
+                for code in sorted(candidates, key=lambda c: preferred.index(c) if c in preferred else len(preferred)):
+                    for track in tracks[code]:
+                        if track.get('ext') == 'json3' and track.get('url'):
+                            return track['url']
+        return None
+
+    def _fetch_caption_track(self, caption_url: str, video_duration: Optional[float] = None) -> Optional[List[Dict]]:
+        try:
+            response = requests.get(caption_url, timeout=30)
+            response.raise_for_status()
+            events = response.json().get('events', [])
+        except Exception as e:
+            logger.error(f"Failed to fetch caption track: {type(e).__name__}: {e}")
+            return None
+
+        formatted = self._caption_events_to_transcript(events, video_duration)
+        if not formatted:
+            return None
+        logger.info("Successfully fetched transcript from caption track.")
+        return formatted
+
+    def _caption_events_to_transcript(self, events: List[Dict], video_duration: Optional[float] = None) -> List[Dict]:
+        # Same entry shape as get_timestamped_transcript_from_url; events without a duration
+        # (common for ASR tracks) run until the next event starts, or the end of the video
+        starts = [event.get('tStartMs', 0) / 1000 for event in events]
+
+        # One backward pass recording the first strictly later start after each event
+        next_starts = [None] * len(events)
+        later = [float(video_duration)] if video_duration else []
+        for i in range(len(events) - 1, -1, -1):
+            while later and later[-1] <= starts[i]:
+                later.pop()
+            next_starts[i] = later[-1] if later else starts[i]
+            later.append(starts[i])
+
+        formatted = []
+        for i, event in enumerate(events):
+            text = ''.join(seg.get('utf8', '') for seg in event.get('segs', [])).strip()
+            if not text:
+                continue
+            start = starts[i]
+            if 'dDurationMs' in event:
+                duration = event['dDurationMs'] / 1000
+            else:
+                duration = next_starts[i] - start
+            formatted.append({
+                'text': text,
+                'start': start,
+                'duration': duration,
+                'timestamp': self._seconds_to_timestamp(start)
+            })
+        return formatted
+
     def _seconds_to_timestamp(self, seconds: float) -> str:
         return str(timedelta(seconds=int(seconds)))
 
 def getTranscript(video_url: str) -> Optional[Dict]:    
     extractor = VideoExtractor()
-    transcript = extractor.get_timestamped_transcript_from_url(video_url=video_url)
-
-    # Instead of downloading the entire video, just get the direct URL for later use
-    direct_video_url = None
-    try:
-        ydl_opts = {'format': 'mp4/best', 'quiet': True}
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(video_url, download=False)
-            direct_video_url = info['url']
-        logger.info(f"Retrieved direct video URL for efficient clip processing")
-    except Exception as e:
-        logger.error(f"Failed to get direct video URL: {e}")
+    metadata = extractor.get_video_metadata(video_url=video_url)
 
-    if transcript:
-        return {"transcript": transcript, "direct_video_url": direct_video_url}
+    if metadata['transcript']:
+        return metadata
     else:
         print("\n❌ Failed to get or generate transcript.")
         return None
@@ -260,7 +350,8 @@ def _pad_and_burn_subtitles(input_clip: str, srt_file: str, start_time: float, e
         logger.error(f"Exception during processing: {e}")
         return False
 
-def getVideoClipFromUrl(direct_video_url: str, start_time: float, end_time: float) -> bytes:
+def getVideoClipFromUrl(direct_video_url: str, start_time: float, end_time: float,
+                        duration: Optional[float] = None) -> bytes:
     """
     Efficient clip generation: streams only the required portion of the video.
     
@@ -268,10 +359,16 @@ def getVideoClipFromUrl(direct_video_url: str, start_time: float, end_time: floa
         direct_video_url: Direct URL to the video file
         start_time: Start time in seconds
         end_time: End time in seconds
+        duration: Known video duration from getTranscript, used to clamp end_time
         
     Returns:
         bytes: Video clip bytes, or empty bytes on failure
     """
+    if duration:
+        end_time = min(end_time, duration)
+    if end_time <= start_time:
+        logger.error(f"Empty clip range {start_time}s - {end_time}s")
+        return b""
     logger.info(f"Processing video clip from {start_time}s to {end_time}s using direct URL")
     
     clip_path = tempfile.mktemp(suffix=".mp4")
@@ -24,7 +24,8 @@ def get_transcript():
 
     return jsonify({
         'transcript': result['transcript'],
-        'direct_video_url': result.get('direct_video_url')
+        'direct_video_url': result.get('direct_video_url'),
+        'duration': result.get('duration')
     })
 
 @app.route('/get_clip', methods=['POST'])
@@ -77,15 +78,29 @@ def get_clip_from_url():
     start_time = data.get('start_time')
     end_time = data.get('end_time')
     direct_video_url = data.get('direct_video_url')
+    duration = data.get('duration')
 
     if not start_time or not end_time or not direct_video_url:
         return jsonify({'error': 'Missing start_time, end_time, or direct_video_url'}), 400
+
+    try:
+        start_time = float(start_time)
+        end_time = float(end_time)
+        duration = float(duration) if duration is not None else None
+    except (TypeError, ValueError):
+        return jsonify({'error': 'start_time, end_time and duration must be numbers'}), 400
+
+    if end_time <= start_time:
+        return jsonify({'error': 'end_time must be after start_time'}), 400
+
+    if duration is not None and start_time >= duration:
+        return jsonify({'error': 'start_time is past the end of the video'}), 400
     
     try:
         print(f"Creating clip {start_time}s - {end_time}s from direct URL")
         
         # Generate the clip directly from URL (much more efficient!)
-        clip_bytes = getVideoClipFromUrl(direct_video_url, start_time, end_time)
+        clip_bytes = getVideoClipFromUrl(direct_video_url, start_time, end_time, duration)
         
         if not clip_bytes:
             print("Failed to generate video clip - no bytes returned")
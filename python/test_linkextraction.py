@@ -0,0 +1,79 @@
+"""
+Unit checks for caption track selection and json3 parsing in linkextraction
+"""
+
+from linkextraction import VideoExtractor, getVideoClipFromUrl
+
+# Trimmed json3 ASR track: a rolling line with a duration, a newline-only
+# aAppend event, and appended lines that carry no dDurationMs
+JSON3_EVENTS = [
+    {'tStartMs': 0, 'dDurationMs': 4000, 'id': 1, 'wpWinPosId': 1, 'wsWinStyleId': 1},
+    {'tStartMs': 160, 'dDurationMs': 2400, 'wWinId': 1,
+     'segs': [{'utf8': 'welcome'}, {'utf8': ' to', 'tOffsetMs': 320}, {'utf8': ' lecture', 'tOffsetMs': 640}]},
+    {'tStartMs': 2560, 'wWinId': 1, 'aAppend': 1, 'segs': [{'utf8': '\n'}]},
+    {'tStartMs': 2570, 'wWinId': 1, 'aAppend': 1,
+     'segs': [{'utf8': 'linear'}, {'utf8': ' algebra', 'tOffsetMs': 400}]},
+    {'tStartMs': 5120, 'wWinId': 1, 'aAppend': 1, 'segs': [{'utf8': 'today'}]},
+]
+
+
+def _extractor(tmp_path):
+    return VideoExtractor(download_dir=str(tmp_path))
+
+
+def test_select_caption_url_prefers_uploaded_subtitles(tmp_path):
+    info = {
+        'subtitles': {'en-US': [{'ext': 'vtt', 'url': 'vtt'}, {'ext': 'json3', 'url': 'manual'}]},
+        'automatic_captions': {'en-orig': [{'ext': 'json3', 'url': 'asr'}]},
+    }
+    assert _extractor(tmp_path)._select_caption_url(info) == 'manual'
+
+
+def test_select_caption_url_prefers_original_asr_track(tmp_path):
+    info = {
+        'subtitles': {},
+        'automatic_captions': {
+            'en': [{'ext': 'json3', 'url': 'translated'}],
+            'en-orig': [{'ext': 'json3', 'url': 'original'}],
+            'fr': [{'ext': 'json3', 'url': 'french'}],
+        },
+    }
+    assert _extractor(tmp_path)._select_caption_url(info) == 'original'
+
+
+def test_select_caption_url_without_json3_track(tmp_path):
+    info = {'subtitles': {'en': [{'ext': 'vtt', 'url': 'vtt'}]}, 'automatic_captions': {}}
+    assert _extractor(tmp_path)._select_caption_url(info) is None
+
+
+def test_caption_events_match_transcript_api_shape(tmp_path):
+    transcript = _extractor(tmp_path)._caption_events_to_transcript(JSON3_EVENTS, video_duration=7)
+
+    assert [entry['text'] for entry in transcript] == ['welcome to lecture', 'linear algebra', 'today']
+    for entry in transcript:
+        assert set(entry) == {'text', 'start', 'duration', 'timestamp'}
+        assert isinstance(entry['start'], float)
+        assert isinstance(entry['duration'], float)
+
+    assert transcript[0]['duration'] == 2.4
+    # aAppend events without dDurationMs run until the next event starts
+    assert transcript[1]['start'] == 2.57
+    assert abs(transcript[1]['duration'] - 2.55) < 1e-9
+    assert transcript[2]['timestamp'] == '0:00:05'
+    # The trailing event runs until the end of the video
+    assert abs(transcript[2]['duration'] - 1.88) < 1e-9
+
+
+def test_caption_events_skip_earlier_starts_when_filling_duration(tmp_path):
+    events = [
+        {'tStartMs': 1000, 'segs': [{'utf8': 'first'}]},
+        {'tStartMs': 500, 'segs': [{'utf8': 'overlap'}]},
+        {'tStartMs': 1000, 'segs': [{'utf8': 'same start'}]},
+        {'tStartMs': 3000, 'segs': [{'utf8': 'last'}]},
+    ]
+    transcript = _extractor(tmp_path)._caption_events_to_transcript(events)
+    assert [entry['duration'] for entry in transcript] == [2.0, 0.5, 2.0, 0.0]
+
+
+def test_clip_from_url_rejects_range_past_duration():
+    assert getVideoClipFromUrl('http://example.invalid/video.mp4', 120, 150, duration=100) == b""
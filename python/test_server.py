@@ -0,0 +1,34 @@
+"""
+Request validation checks for the Flask endpoints
+"""
+
+import pytest
+
+from server import app
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+@pytest.mark.parametrize('body, error', [
+    ({'start_time': 'abc', 'end_time': 10}, 'start_time, end_time and duration must be numbers'),
+    ({'start_time': 5, 'end_time': 10, 'duration': 'long'}, 'start_time, end_time and duration must be numbers'),
+    ({'start_time': '20', 'end_time': '10'}, 'end_time must be after start_time'),
+    ({'start_time': 120, 'end_time': 150, 'duration': 100}, 'start_time is past the end of the video'),
+])
+def test_get_clip_from_url_rejects_invalid_range(client, body, error):
+    response = client.post('/get_clip_from_url', json={'direct_video_url': 'http://example.invalid/v.mp4', **body})
+    assert response.status_code == 400
+    assert response.get_json()['error'] == error
+
+
+def test_get_clip_from_url_passes_converted_times(client, monkeypatch):
+    calls = []
+    monkeypatch.setattr('server.getVideoClipFromUrl', lambda *args: calls.append(args) or b'clip')
+    response = client.post('/get_clip_from_url', json={
+        'direct_video_url': 'http://example.invalid/v.mp4', 'start_time': '5', 'end_time': 12, 'duration': '60',
+    })
+    assert response.status_code == 200
+    assert calls == [('http://example.invalid/v.mp4', 5.0, 12.0, 60.0)]
@@ -22,7 +22,7 @@ async function getTranscript(link: any): Promise<any> {
     }
 
     const data = await response.json();
-    return [data.transcript, data.direct_video_url];
+    return [data.transcript, data.direct_video_url, data.duration];
 }
 
 async function getSummary(transcript: any): Promise<any> {
@@ -106,7 +106,7 @@ async function chooseImportantClips(transcript: any, topics: any): Promise<any>
     return JSON.parse(response.text || '')?.clips || [];
 }
 
-async function getClips(clips: any, direct_video_url: any): Promise<any> {
+async function getClips(clips: any, direct_video_url: any, duration?: number): Promise<any> {
     const clipsWithBytes = [];
     
     for (let i = 0; i < clips.length; i++) {
@@ -123,7 +123,8 @@ async function getClips(clips: any, direct_video_url: any): Promise<any> {
                 body: JSON.stringify({ 
                     start_time: clip.start_time, 
                     end_time: clip.end_time, 
-                    direct_video_url: direct_video_url 
+                    direct_video_url: direct_video_url,
+                    duration: duration
                 }),
                 // Reduced timeout since this should be much faster
                 signal: AbortSignal.timeout(120000) // 2 minute timeout
@@ -12,8 +12,8 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // Get transcript and direct video URL
-    const [transcript, direct_video_url] = await getTranscript(link);
+    // Get transcript, direct video URL and duration in one metadata pass
+    const [transcript, direct_video_url, duration] = await getTranscript(link);
     
     if (!transcript) {
       return NextResponse.json(
@@ -29,7 +29,7 @@ export async function POST(request: NextRequest) {
     const clips = await chooseImportantClips(transcript, topics);
     
     // Get actual clip data using efficient streaming
-    const clipsWithBytes = await getClips(clips, direct_video_url);
+    const clipsWithBytes = await getClips(clips, direct_video_url, duration);
 
     return NextResponse.json({
       success: true,